@@ -71,11 +71,9 @@ class VmwareInventoryHost(ABC):
         # Custom values
         if hasattr(self.object, "customValue"):
             properties['customValue'] = dict()
-            field_mgr = pyvmomi_client.custom_field_mgr
+            field_key_to_name = {y.key: y.name for y in pyvmomi_client.custom_field_mgr}
             for cust_value in self.object.customValue:
-                properties['customValue'][
-                    [y.name for y in field_mgr if y.key == cust_value.key][0]
-                ] = cust_value.value
+                properties['customValue'][field_key_to_name[cust_value.key]] = cust_value.value
 
         return properties
 
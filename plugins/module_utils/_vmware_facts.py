@@ -65,16 +65,15 @@ class VmFacts():
     def custom_attribute_facts(self, content):
         custom_value_facts = {}
         custom_fields_manager = content.customFieldsManager
+        field_key_to_name = None
+        if custom_fields_manager is not None and custom_fields_manager.field:
+            field_key_to_name = {field.key: field.name for field in custom_fields_manager.field}
 
         for custom_value_obj in self.vm.summary.customValue:
-            if custom_fields_manager is None or not custom_fields_manager.field:
+            if field_key_to_name is None:
                 custom_value_facts[custom_value_obj.key] = custom_value_obj.value
-                continue
-
-            for field in custom_fields_manager.field:
-                if field.key == custom_value_obj.key:
-                    custom_value_facts[field.name] = custom_value_obj.value
-                    break
+            elif custom_value_obj.key in field_key_to_name:
+                custom_value_facts[field_key_to_name[custom_value_obj.key]] = custom_value_obj.value
 
         return {
             'customvalues': custom_value_facts,
@@ -126,10 +125,11 @@ class VmFacts():
 
     def vnc_facts(self):
         facts = {}
+        vnc_option_keys = {"remotedisplay.vnc." + optkeyname: optkeyname for optkeyname in ['enabled', 'ip', 'port', 'password']}
         for opts in self.vm.config.extraConfig:
-            for optkeyname in ['enabled', 'ip', 'port', 'password']:
-                if opts.key.lower() == "remotedisplay.vnc." + optkeyname:
-                    facts[optkeyname] = opts.value
+            optkeyname = vnc_option_keys.get(opts.key.lower())
+            if optkeyname:
+                facts[optkeyname] = opts.value
 
         return {'vnc': facts}
 
@@ -434,7 +434,7 @@ def list_snapshots_recursively(snapshots):
     snapshot_data = []
     for snapshot in snapshots:
         snapshot_data.append(deserialize_snapshot_obj(snapshot))
-        snapshot_data = snapshot_data + list_snapshots_recursively(snapshot.childSnapshotList)
+        snapshot_data.extend(list_snapshots_recursively(snapshot.childSnapshotList))
     return snapshot_data
 
 
@@ -443,7 +443,7 @@ def get_current_snap_obj(snapshots, snapob):
     for snapshot in snapshots:
         if snapshot.snapshot == snapob:
             snap_obj.append(snapshot)
-        snap_obj = snap_obj + get_current_snap_obj(snapshot.childSnapshotList, snapob)
+        snap_obj.extend(get_current_snap_obj(snapshot.childSnapshotList, snapob))
     return snap_obj
 
 
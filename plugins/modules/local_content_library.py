@@ -310,10 +310,10 @@ class VmwareContentLibrary(ModuleRestBase):
             return True
 
         if self.params['publish']:
-            if any([
-                (self.existing_library.publish_info.persist_json_enabled != self.params['persist_json_enabled']),
-                (self.existing_library.publish_info.authentication_method != self.params['authentication_method']),
-            ]):
+            if (
+                self.existing_library.publish_info.persist_json_enabled != self.params['persist_json_enabled']
+                or self.existing_library.publish_info.authentication_method != self.params['authentication_method']
+            ):
                 return True
 
         return False
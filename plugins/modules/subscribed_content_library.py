@@ -240,13 +240,13 @@ class VmwareContentLibrary(ModuleRestBase):
         if self.params['always_update_password'] and self.params['authentication_password']:
             return True
 
-        if any([
-            (self.existing_library.description != self.params['description']),
-            (self.existing_library.subscription_info.authentication_method != self.params['authentication_method']),
-            (self.existing_library.subscription_info.subscription_url != self.params['subscription_url']),
-            (self.existing_library.subscription_info.on_demand != self.params['update_on_demand']),
-            (self.existing_library.subscription_info.ssl_thumbprint != self.params['ssl_thumbprint'])
-        ]):
+        if (
+            self.existing_library.description != self.params['description']
+            or self.existing_library.subscription_info.authentication_method != self.params['authentication_method']
+            or self.existing_library.subscription_info.subscription_url != self.params['subscription_url']
+            or self.existing_library.subscription_info.on_demand != self.params['update_on_demand']
+            or self.existing_library.subscription_info.ssl_thumbprint != self.params['ssl_thumbprint']
+        ):
             return True
 
     def update_library(self):